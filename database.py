@@ -18,6 +18,10 @@ load_dotenv()
 _client = None
 db = None
 
+# Async handle for endpoints running on the event loop, created on first use
+_async_client = None
+_async_db = None
+
 database_url = os.getenv("DATABASE_URL")
 database_name = os.getenv("DATABASE_NAME")
 
@@ -25,6 +29,16 @@ if database_url and database_name:
     _client = MongoClient(database_url)
     db = _client[database_name]
 
+def get_async_db():
+    """Return the Motor database handle, connecting on first call"""
+    global _async_client, _async_db
+    if _async_db is None and database_url and database_name:
+        from motor.motor_asyncio import AsyncIOMotorClient
+
+        _async_client = AsyncIOMotorClient(database_url)
+        _async_db = _async_client[database_name]
+    return _async_db
+
 # Helper functions for common database operations
 def create_document(collection_name: str, data: Union[BaseModel, dict]):
     """Insert a single document with timestamp"""
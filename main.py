@@ -1,10 +1,24 @@
+import hashlib
 import os
-from fastapi import FastAPI
+import sys
+import time
+from functools import lru_cache
+import orjson
+from fastapi import FastAPI, Header, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from markupsafe import escape
+from typing import List, Dict, Any, Optional
+from urllib.parse import quote_plus
 
-app = FastAPI(title="AI Power - Hyper Generate API")
+IS_PRODUCTION = os.getenv("ENV") == "prod"
+
+# Interactive docs and the OpenAPI schema are only mounted outside production.
+if IS_PRODUCTION:
+    app = FastAPI(title="AI Power - Hyper Generate API", docs_url=None, redoc_url=None, openapi_url=None)
+else:
+    app = FastAPI(title="AI Power - Hyper Generate API")
 
 app.add_middleware(
     CORSMiddleware,
@@ -14,37 +28,7 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-
-class StoryboardFrame(BaseModel):
-    t: float
-    title: str
-    description: str
-    camera: str
-    elements: List[str]
-
-
-class AudioLayer(BaseModel):
-    name: str
-    type: str
-    waveform: str
-    notes: Optional[List[float]] = None
-    base_freq: Optional[float] = None
-    lfo_freq: Optional[float] = None
-    reverb: Optional[float] = None
-    volume: float = 0.5
-
-
-class HyperGenerateRequest(BaseModel):
-    prompt: str
-
-
-class HyperGenerateResponse(BaseModel):
-    prompt: str
-    code_snippets: Dict[str, str]
-    video: Dict[str, Any]
-    audio: Dict[str, Any]
-    image_svg: str
-    text_response: str
+app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=6)
 
 
 @app.get("/")
@@ -57,8 +41,33 @@ def hello():
     return {"message": "Hello from the backend API!"}
 
 
+# Resolve the optional database module once at startup rather than on every /test hit.
+try:
+    from database import get_async_db
+    _database_import_error = None
+except ImportError:
+    get_async_db = None
+    _database_import_error = "❌ Database module not found (run enable-database first)"
+except Exception as e:
+    get_async_db = None
+    _database_import_error = f"❌ Error: {str(e)[:50]}"
+
+# Collection names rarely change, so health checks reuse them for a short while
+# instead of issuing a listCollections round trip on every poll.
+_COLLECTIONS_TTL_SEC = 30.0
+_collections_cache: Dict[str, Any] = {"ts": 0.0, "val": None}
+
+
+async def _list_collection_names(async_db) -> List[str]:
+    now = time.monotonic()
+    if _collections_cache["val"] is None or now - _collections_cache["ts"] > _COLLECTIONS_TTL_SEC:
+        _collections_cache["val"] = await async_db.list_collection_names()
+        _collections_cache["ts"] = now
+    return _collections_cache["val"]
+
+
 @app.get("/test")
-def test_database():
+async def test_database():
     """Test endpoint to check if database is available and accessible"""
     response = {
         "backend": "✅ Running",
@@ -69,38 +78,47 @@ def test_database():
         "collections": []
     }
 
-    try:
-        from database import db
-
-        if db is not None:
-            response["database"] = "✅ Available"
-            response["database_url"] = "✅ Configured"
-            response["database_name"] = db.name if hasattr(db, 'name') else "✅ Connected"
-            response["connection_status"] = "Connected"
-            try:
-                collections = db.list_collection_names()
-                response["collections"] = collections[:10]
-                response["database"] = "✅ Connected & Working"
-            except Exception as e:
-                response["database"] = f"⚠️  Connected but Error: {str(e)[:50]}"
+    async_db = None
+    if _database_import_error is not None:
+        response["database"] = _database_import_error
+    else:
+        try:
+            async_db = get_async_db()
+        except ImportError:
+            response["database"] = "❌ Async driver not installed (pip install motor)"
+        except Exception as e:
+            response["database"] = f"❌ Error: {str(e)[:50]}"
         else:
-            response["database"] = "⚠️  Available but not initialized"
-
-    except ImportError:
-        response["database"] = "❌ Database module not found (run enable-database first)"
-    except Exception as e:
-        response["database"] = f"❌ Error: {str(e)[:50]}"
+            if async_db is None:
+                response["database"] = "⚠️  Available but not initialized"
+
+    if async_db is not None:
+        response["database"] = "✅ Available"
+        response["database_url"] = "✅ Configured"
+        response["database_name"] = async_db.name if hasattr(async_db, 'name') else "✅ Connected"
+        response["connection_status"] = "Connected"
+        try:
+            collections = await _list_collection_names(async_db)
+            response["collections"] = collections[:10]
+            response["database"] = "✅ Connected & Working"
+        except Exception as e:
+            response["database"] = f"⚠️  Connected but Error: {str(e)[:50]}"
 
-    import os
     response["database_url"] = "✅ Set" if os.getenv("DATABASE_URL") else "❌ Not Set"
     response["database_name"] = "✅ Set" if os.getenv("DATABASE_NAME") else "❌ Not Set"
 
     return response
 
 
-def build_image_svg(prompt: str) -> str:
-    # Generate a high-res SVG with a monolith and electric blue glow
-    svg = f'''<svg xmlns="http://www.w3.org/2000/svg" width="2400" height="1350" viewBox="0 0 2400 1350">
+# The SVG scene is identical for every request except for the prompt caption,
+# so it is rendered once at import and the caption is substituted per call.
+_svg_circle_parts = [None] * 19
+for i in range(1, 20):
+    _svg_circle_parts[i - 1] = '<circle cx="%d" cy="%d" r="%d" fill="#6B21A8" opacity="0.25"/>' % (i*220, (i*97)%1350, 80+(i%5)*18)
+_SVG_CIRCLES = ''.join(_svg_circle_parts)
+del _svg_circle_parts, i
+
+_SVG_TEMPLATE = f'''<svg xmlns="http://www.w3.org/2000/svg" width="2400" height="1350" viewBox="0 0 2400 1350">
       <defs>
         <radialGradient id="glow" cx="50%" cy="60%" r="60%">
           <stop offset="0%" stop-color="#6EE7F9" stop-opacity="0.9"/>
@@ -117,7 +135,7 @@ def build_image_svg(prompt: str) -> str:
       </defs>
       <rect width="100%" height="100%" fill="url(#sky)"/>
       <g opacity="0.25">
-        {''.join([f'<circle cx="{i*220}" cy="{(i*97)%1350}" r="{80+(i%5)*18}" fill="#6B21A8" opacity="0.25"/>' for i in range(1,20)])}
+        {_SVG_CIRCLES}
       </g>
       <ellipse cx="1200" cy="980" rx="800" ry="220" fill="#0B1020" opacity="0.9"/>
       <ellipse cx="1200" cy="980" rx="820" ry="240" fill="#1E293B" opacity="0.35" filter="url(#blur)"/>
@@ -127,101 +145,220 @@ def build_image_svg(prompt: str) -> str:
       <rect x="1128" y="330" width="144" height="640" rx="3" fill="#0A0F1D"/>
       <ellipse cx="1200" cy="980" rx="520" ry="140" fill="url(#glow)"/>
       <circle cx="1200" cy="620" r="420" fill="url(#glow)"/>
-      <text x="1200" y="1240" text-anchor="middle" font-family="Inter, system-ui" font-size="28" fill="#94A3B8" opacity="0.9">{prompt}</text>
+      <text x="1200" y="1240" text-anchor="middle" font-family="Inter, system-ui" font-size="28" fill="#94A3B8" opacity="0.9">@@PROMPT@@</text>
     </svg>'''
-    return svg
-
-
-def build_code_snippets() -> Dict[str, str]:
-    python_fn = (
-        "import math\n"
-        "def estimate_monolith_gravity(mass_kg: float, distance_m: float) -> float:\n"
-        "    \"\"\"Return gravitational acceleration (m/s^2) at a distance from the monolith using Newton's law.\n"
-        "    G = 6.67430e-11\n"
-        "    return G * mass_kg / (distance_m ** 2)\n\n"
-        "def estimate_energy_emission(area_m2: float, emissive_w_per_m2: float) -> float:\n"
-        "    \"\"\"Estimate radiant power output (Watts) from a glowing surface.\n"
-        "    return area_m2 * emissive_w_per_m2\n"
-    )
 
-    kotlin_fn = (
-        "import kotlin.math.pow\n\n"
-        "object MonolithPhysics {\n"
-        "  private const val G: Double = 6.67430e-11\n\n"
-        "  fun gravity(massKg: Double, distanceM: Double): Double {\n"
-        "    return G * massKg / distanceM.pow(2.0)\n"
-        "  }\n\n"
-        "  fun energy(areaM2: Double, emissiveWPerM2: Double): Double {\n"
-        "    return areaM2 * emissiveWPerM2\n"
-        "  }\n"
-        "}\n"
+
+# Split around the caption so inserting a prompt is a concatenation, not a search.
+_SVG_PREFIX, _SVG_SUFFIX = (part.encode() for part in _SVG_TEMPLATE.split("@@PROMPT@@"))
+
+
+def build_image_svg(prompt: str) -> bytes:
+    # Generate a high-res SVG with a monolith and electric blue glow
+    return _SVG_PREFIX + str(escape(prompt)).encode() + _SVG_SUFFIX
+
+
+# Prompts are unbounded, so only short ones are memoized; this caps each entry at a
+# few KB and the whole cache at a few MB per worker.
+_MAX_CACHED_PROMPT_LEN = 512
+_build_image_svg_cached = lru_cache(maxsize=1024)(build_image_svg)
+
+
+IMAGE_SVG_PATH = "/api/image.svg"
+
+
+def build_image_svg_url(prompt: str) -> str:
+    return f"{IMAGE_SVG_PATH}?prompt={quote_plus(prompt)}"
+
+
+_PYTHON_SNIPPET = (
+    "import math\n"
+    "def estimate_monolith_gravity(mass_kg: float, distance_m: float) -> float:\n"
+    "    \"\"\"Return gravitational acceleration (m/s^2) at a distance from the monolith using Newton's law.\n"
+    "    G = 6.67430e-11\n"
+    "    return G * mass_kg / (distance_m ** 2)\n\n"
+    "def estimate_energy_emission(area_m2: float, emissive_w_per_m2: float) -> float:\n"
+    "    \"\"\"Estimate radiant power output (Watts) from a glowing surface.\n"
+    "    return area_m2 * emissive_w_per_m2\n"
+)
+
+_KOTLIN_SNIPPET = (
+    "import kotlin.math.pow\n\n"
+    "object MonolithPhysics {\n"
+    "  private const val G: Double = 6.67430e-11\n\n"
+    "  fun gravity(massKg: Double, distanceM: Double): Double {\n"
+    "    return G * massKg / distanceM.pow(2.0)\n"
+    "  }\n\n"
+    "  fun energy(areaM2: Double, emissiveWPerM2: Double): Double {\n"
+    "    return areaM2 * emissiveWPerM2\n"
+    "  }\n"
+    "}\n"
+)
+
+_CODE_SNIPPETS: Dict[str, str] = {"python": _PYTHON_SNIPPET, "kotlin": _KOTLIN_SNIPPET}
+
+
+# Storyboard frames and audio layers do not depend on the prompt, so they are
+# kept as plain dicts and shared across requests instead of being rebuilt.
+_STORYBOARD: List[Dict[str, Any]] = [
+    {"t": 0.0, "title": "Approach", "description": "Camera glides over the lunar terminator into darkness.", "camera": "slow-dolly-in", "elements": ["stars", "wireframe spheres", "moon horizon"]},
+    {"t": 10.0, "title": "Reveal", "description": "Electric-blue glow blooms, outlining the monolith.", "camera": "tilt-up", "elements": ["monolith", "glow", "regolith dust"]},
+    {"t": 25.0, "title": "Inscription", "description": "Ancient symbols flicker across the obsidian face.", "camera": "macro-pan", "elements": ["symbols", "blue runes"]},
+    {"t": 40.0, "title": "Distortion", "description": "Subtle lens warps hint at gravitational shear.", "camera": "orbit", "elements": ["gravitational ripple", "ionized haze"]},
+    {"t": 55.0, "title": "Contact", "description": "Astronaut silhouette reaches out as hum crescendos.", "camera": "push-in", "elements": ["astronaut", "ribbon light"]},
+]
+
+_AUDIO_LAYERS: List[Dict[str, Any]] = [
+    {"name": "Sub Bass Drone", "type": "drone", "waveform": "sine", "notes": None, "base_freq": 41.2, "lfo_freq": 0.06, "reverb": 0.6, "volume": 0.35},
+    {"name": "Iridescent Ribbon", "type": "pad", "waveform": "triangle", "notes": None, "base_freq": 220.0, "lfo_freq": 0.12, "reverb": 0.5, "volume": 0.25},
+    {"name": "Grain Hiss", "type": "noisepad", "waveform": "noise", "notes": None, "base_freq": 0.0, "lfo_freq": 0.2, "reverb": 0.7, "volume": 0.15},
+    {"name": "Beacon Pulses", "type": "pulse", "waveform": "sine", "notes": [440.0, 554.37, 659.25, 880.0], "base_freq": None, "lfo_freq": 0.5, "reverb": 0.3, "volume": 0.2},
+]
+
+
+_NARRATION = (
+    "On the dark side of the Moon, beyond the reach of Earth's gaze, a monolith rises from the regolith—"
+    "its surface black as void, its edges trembling with a faint electric-blue aura. Symbols, older than language,"
+    " coil and awaken across its face. Instruments whisper anomalies: gravity bends by imperceptible degrees,"
+    " and the static hum resolves into a pattern. This is not a beacon. It is a key—waiting for the question we have yet to ask."
+)
+
+_TEXT_RESPONSE = (
+    "The monolith appears to operate as a multi-modal artifact: part gravitational lens, part information lattice. "
+    "The faint electric-blue emission suggests controlled energy leakage—possibly a byproduct of field stabilization. "
+    "The symbols may not be writing in a human sense but a spatial-temporal indexing scheme; think addresses for aligning matter and memory. "
+    "Local perturbations in spacetime hint at a tuned mass effect, allowing the structure to modulate gravity as a carrier wave. "
+    "A plausible function is archival: a vault that stores states—maps, genomes, histories—encoded as resonant patterns in vacuum fluctuations. "
+    "Contact protocols should avoid RF injection and instead vary inertial frames: micro-thrust oscillations or lattice vibrations on contact surfaces. "
+    "If the device is a key, the lock may be planetary: a network expecting the Moon, Earth, and Sun to form precise phase relationships. "
+    "In that alignment, the monolith would not open in place; it would redirect—turning the local curvature into a pointer, and us into the message."
+)
+
+
+def build_hyper_generate_response(prompt: str) -> Dict[str, Any]:
+    return {
+        "prompt": prompt,
+        "code_snippets": _CODE_SNIPPETS,
+        "video": {"duration_sec": 60, "narration_text": _NARRATION, "storyboard": _STORYBOARD},
+        "audio": {"duration_sec": 300, "layers": _AUDIO_LAYERS},
+        "image_svg_url": build_image_svg_url(prompt),
+        "text_response": _TEXT_RESPONSE,
+    }
+
+
+# Everything except the prompt is fixed, so the JSON body is encoded once with
+# placeholders and the escaped prompt is spliced into the bytes per request.
+# The top-level field and the image URL are escaped differently, hence two markers.
+_RESPONSE_TEMPLATE_BYTES = orjson.dumps({
+    **build_hyper_generate_response("@@RESPONSE_PROMPT@@"),
+    "image_svg_url": f"{IMAGE_SVG_PATH}?prompt=@@PROMPT_URL@@",
+})
+
+
+def render_hyper_generate_response(prompt: str) -> bytes:
+    if "@@" in prompt:
+        # The prompt could itself contain a marker and be substituted twice; encode it in full.
+        return orjson.dumps(build_hyper_generate_response(prompt))
+    return (
+        _RESPONSE_TEMPLATE_BYTES
+        .replace(b"@@RESPONSE_PROMPT@@", orjson.dumps(prompt)[1:-1])
+        .replace(b"@@PROMPT_URL@@", quote_plus(prompt).encode())
     )
-    return {"python": python_fn, "kotlin": kotlin_fn}
 
 
-def build_storyboard(prompt: str) -> List[StoryboardFrame]:
-    frames = [
-        StoryboardFrame(t=0, title="Approach", description="Camera glides over the lunar terminator into darkness.", camera="slow-dolly-in", elements=["stars", "wireframe spheres", "moon horizon"]).dict(),
-        StoryboardFrame(t=10, title="Reveal", description="Electric-blue glow blooms, outlining the monolith.", camera="tilt-up", elements=["monolith", "glow", "regolith dust"]).dict(),
-        StoryboardFrame(t=25, title="Inscription", description="Ancient symbols flicker across the obsidian face.", camera="macro-pan", elements=["symbols", "blue runes"]).dict(),
-        StoryboardFrame(t=40, title="Distortion", description="Subtle lens warps hint at gravitational shear.", camera="orbit", elements=["gravitational ripple", "ionized haze"]).dict(),
-        StoryboardFrame(t=55, title="Contact", description="Astronaut silhouette reaches out as hum crescendos.", camera="push-in", elements=["astronaut", "ribbon light"]).dict(),
-    ]
-    return frames
+DEFAULT_PROMPT = "A mysterious object radiating faint electric-blue light on the far side of the Moon."
 
+# The empty-prompt fallback always produces the same payload, so encode it once at import.
+_DEFAULT_RESPONSE_BYTES = orjson.dumps(build_hyper_generate_response(DEFAULT_PROMPT))
 
-def build_audio_layers() -> List[AudioLayer]:
-    return [
-        AudioLayer(name="Sub Bass Drone", type="drone", waveform="sine", base_freq=41.2, lfo_freq=0.06, reverb=0.6, volume=0.35).
-        dict(),
-        AudioLayer(name="Iridescent Ribbon", type="pad", waveform="triangle", base_freq=220.0, lfo_freq=0.12, reverb=0.5, volume=0.25).dict(),
-        AudioLayer(name="Grain Hiss", type="noisepad", waveform="noise", base_freq=0, lfo_freq=0.2, reverb=0.7, volume=0.15).dict(),
-        AudioLayer(name="Beacon Pulses", type="pulse", waveform="sine", notes=[440.0, 554.37, 659.25, 880.0], lfo_freq=0.5, reverb=0.3, volume=0.2).dict(),
-    ]
 
+def _validation_error(error: Dict[str, Any]) -> ORJSONResponse:
+    # Same body shape as FastAPI's RequestValidationError, so clients parsing the
+    # 422 detail list keep working now that the route bypasses FastAPI.
+    return ORJSONResponse({"detail": [error]}, status_code=422)
 
-@app.post("/api/hyper-generate", response_model=HyperGenerateResponse)
-async def hyper_generate(req: HyperGenerateRequest):
-    prompt = req.prompt.strip()
+
+async def hyper_generate(request: Request) -> Response:
+    # The body is {"prompt": str}; read it straight from the parsed dict instead of
+    # constructing a request model for a single field.
+    raw = await request.body()
+    if not raw:
+        return _validation_error({"type": "missing", "loc": ["body"], "msg": "Field required", "input": None})
+    try:
+        body = orjson.loads(raw)
+    except orjson.JSONDecodeError as e:
+        return _validation_error({"type": "json_invalid", "loc": ["body", e.pos], "msg": "JSON decode error", "input": {}, "ctx": {"error": e.msg}})
+
+    if not isinstance(body, dict):
+        return _validation_error({"type": "model_attributes_type", "loc": ["body"], "msg": "Input should be a valid dictionary or object to extract fields from", "input": body})
+    if "prompt" not in body:
+        return _validation_error({"type": "missing", "loc": ["body", "prompt"], "msg": "Field required", "input": body})
+    prompt = body["prompt"]
+    if not isinstance(prompt, str):
+        return _validation_error({"type": "string_type", "loc": ["body", "prompt"], "msg": "Input should be a valid string", "input": prompt})
+
+    prompt = prompt.strip()
     if not prompt:
-        prompt = "A mysterious object radiating faint electric-blue light on the far side of the Moon."
+        return Response(content=_DEFAULT_RESPONSE_BYTES, media_type="application/json")
 
-    narration = (
-        "On the dark side of the Moon, beyond the reach of Earth's gaze, a monolith rises from the regolith—"
-        "its surface black as void, its edges trembling with a faint electric-blue aura. Symbols, older than language,"
-        " coil and awaken across its face. Instruments whisper anomalies: gravity bends by imperceptible degrees,"
-        " and the static hum resolves into a pattern. This is not a beacon. It is a key—waiting for the question we have yet to ask."
-    )
+    return Response(content=render_hyper_generate_response(prompt), media_type="application/json")
 
-    response: HyperGenerateResponse = HyperGenerateResponse(
-        prompt=prompt,
-        code_snippets=build_code_snippets(),
-        video={
-            "duration_sec": 60,
-            "narration_text": narration,
-            "storyboard": build_storyboard(prompt),
-        },
-        audio={
-            "duration_sec": 300,
-            "layers": build_audio_layers(),
-        },
-        image_svg=build_image_svg(prompt),
-        text_response=(
-            "The monolith appears to operate as a multi-modal artifact: part gravitational lens, part information lattice. "
-            "The faint electric-blue emission suggests controlled energy leakage—possibly a byproduct of field stabilization. "
-            "The symbols may not be writing in a human sense but a spatial-temporal indexing scheme; think addresses for aligning matter and memory. "
-            "Local perturbations in spacetime hint at a tuned mass effect, allowing the structure to modulate gravity as a carrier wave. "
-            "A plausible function is archival: a vault that stores states—maps, genomes, histories—encoded as resonant patterns in vacuum fluctuations. "
-            "Contact protocols should avoid RF injection and instead vary inertial frames: micro-thrust oscillations or lattice vibrations on contact surfaces. "
-            "If the device is a key, the lock may be planetary: a network expecting the Moon, Earth, and Sun to form precise phase relationships. "
-            "In that alignment, the monolith would not open in place; it would redirect—turning the local curvature into a pointer, and us into the message."
-        ),
-    )
 
-    return response
+# Registered as a plain Starlette route: the body is parsed by orjson above, so
+# FastAPI's dependency resolution and request validation would be pure overhead.
+app.add_route("/api/hyper-generate", hyper_generate, methods=["POST"])
+
+
+# The SVG only varies with the prompt, so the ETag is derived from the prompt and
+# the template; browsers and CDNs can then revalidate without refetching the body.
+# It is a weak validator because GZipMiddleware serves gzip and identity encodings
+# of the same representation under one tag.
+_SVG_ETAG_SALT = hashlib.blake2b(_SVG_TEMPLATE.encode(), digest_size=16).digest()
+_SVG_CACHE_CONTROL = "public, max-age=86400"
+
+
+def _etag_matches(if_none_match: str, opaque_tag: str) -> bool:
+    # If-None-Match uses weak comparison (RFC 7232 section 3.2): ignore any W/ prefix.
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == opaque_tag:
+            return True
+    return False
+
+
+@app.get(IMAGE_SVG_PATH)
+async def image_svg(prompt: str = "", if_none_match: Optional[str] = Header(None)):
+    prompt = prompt.strip() or DEFAULT_PROMPT
+    opaque_tag = '"%s"' % hashlib.blake2b(prompt.encode(), digest_size=16, salt=_SVG_ETAG_SALT).hexdigest()
+    headers = {"Cache-Control": _SVG_CACHE_CONTROL, "ETag": "W/" + opaque_tag}
+
+    if if_none_match is not None and _etag_matches(if_none_match, opaque_tag):
+        return Response(status_code=304, headers=headers)
+
+    if len(prompt) <= _MAX_CACHED_PROMPT_LEN:
+        svg = _build_image_svg_cached(prompt)
+    else:
+        svg = build_image_svg(prompt)
+    return Response(content=svg, media_type="image/svg+xml", headers=headers)
 
 
 if __name__ == "__main__":
-    import uvicorn
-    port = int(os.getenv("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # Hand over to the uvicorn CLI rather than uvicorn.run("main:app"): the workers
+    # import the app once each, instead of this process loading it a second time as
+    # `main` next to `__main__`. Flags mirror start_server.sh.
+    port = os.getenv("PORT", "8000")
+    # The endpoints are CPU-bound, so run one worker per core unless WEB_CONCURRENCY
+    # (e.g. the container CPU limit) says otherwise.
+    workers = os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1))
+    args = [
+        sys.executable, "-m", "uvicorn", "main:app",
+        "--app-dir", os.path.dirname(os.path.abspath(__file__)),
+        "--host", "0.0.0.0",
+        "--port", port,
+        "--workers", workers,
+        "--loop", "uvloop",
+        "--http", "httptools",
+    ]
+    if IS_PRODUCTION:
+        args += ["--no-access-log", "--log-level", "warning"]
+    os.execv(sys.executable, args)
@@ -15,5 +15,12 @@ mkdir -p logs
 echo "Installing dependencies..."
 pip install -r requirements.txt
 echo "Starting FastAPI server..."
-nohup uvicorn main:app --host 0.0.0.0 --port 8000 --reload > logs/server.log 2>&1 
+# Production runs one worker per core (or WEB_CONCURRENCY) without access logs;
+# everything else keeps the single auto-reloading dev server.
+if [ "$ENV" = "prod" ]; then
+  UVICORN_FLAGS="--workers ${WEB_CONCURRENCY:-$(nproc)} --no-access-log --log-level warning"
+else
+  UVICORN_FLAGS="--reload"
+fi
+nohup uvicorn main:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools $UVICORN_FLAGS > logs/server.log 2>&1 
 echo "Server started in background"